@@ -18,7 +18,8 @@ from .const import (
     CONF_UPS_SCAN_INTERVAL, 
     DEFAULT_UPS_SCAN_INTERVAL,
     CONF_ROOT_PASSWORD,
-    CONF_ENABLE_DOCKER
+    CONF_ENABLE_DOCKER,
+    CONF_LOCAL_READS
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -220,6 +221,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_ENABLE_DOCKER,
                 default=data.get(CONF_ENABLE_DOCKER, False)
+            ): bool,
+            # HA与NAS运行在同一系统时，直接读取本机的 /proc、/sys 文件
+            vol.Optional(
+                CONF_LOCAL_READS,
+                default=data.get(CONF_LOCAL_READS, False)
             ): bool
         })
         
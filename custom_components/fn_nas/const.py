@@ -19,6 +19,7 @@ CONF_IGNORE_DISKS = "ignore_disks"
 CONF_MAC = "mac"
 CONF_UPS_SCAN_INTERVAL = "ups_scan_interval"
 CONF_ENABLE_DOCKER = "enable_docker"
+CONF_LOCAL_READS = "local_reads"
 DOCKER_CONTAINERS = "docker_containers"
 
 DEFAULT_PORT = 22
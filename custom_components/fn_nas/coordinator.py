@@ -10,7 +10,7 @@ from .const import (
     DOMAIN, CONF_HOST, CONF_PORT, CONF_USERNAME, CONF_PASSWORD,
     CONF_IGNORE_DISKS, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL,
     DEFAULT_PORT, CONF_MAC, CONF_UPS_SCAN_INTERVAL, DEFAULT_UPS_SCAN_INTERVAL,
-    CONF_ROOT_PASSWORD, CONF_ENABLE_DOCKER
+    CONF_ROOT_PASSWORD, CONF_ENABLE_DOCKER, CONF_LOCAL_READS
 )
 from .disk_manager import DiskManager
 from .system_manager import SystemManager
@@ -33,6 +33,7 @@ class FlynasCoordinator(DataUpdateCoordinator):
         self.mac = config.get(CONF_MAC, "")
         self.enable_docker = config.get(CONF_ENABLE_DOCKER, False)
         self.docker_manager = DockerManager(self) if self.enable_docker else None
+        self.local_reads = config.get(CONF_LOCAL_READS, False)
         self.ssh = None
         self.ssh_closed = True
         # SSH连接池管理
@@ -67,6 +68,15 @@ class FlynasCoordinator(DataUpdateCoordinator):
         # 添加日志方法
         self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
     
+    @property
+    def reads_locally(self) -> bool:
+        """是否在本进程直接读取 /proc、/sys 文件
+        
+        仅在选项中显式开启且主机为本机地址时生效（HA OS/Docker 中SSH到本机不一定是同一文件系统）；
+        需要sudo执行命令时仍通过命令读取
+        """
+        return self.local_reads and self.host in ['localhost', '127.0.0.1'] and not self.use_sudo
+    
     def get_default_data(self):
         """返回默认的数据结构"""
         return {
@@ -5,6 +5,33 @@ from .const import CONF_IGNORE_DISKS
 
 _LOGGER = logging.getLogger(__name__)
 
+# 获取失败或硬盘非活跃时，从缓存回填的字段
+_CACHED_FALLBACK_FIELDS = ("model", "serial", "capacity", "temperature", "power_on_hours")
+
+# smartctl 输出中 "键: 值" 行到字段的映射：键 -> (字段, 优先级)，数字越小越优先
+_INFO_KEY_MAP = {
+    "device model": ("model", 0),
+    "model family": ("model", 1),
+    "model": ("model", 1),
+    "model number": ("model", 2),
+    "serial number": ("serial", 0),
+    "user capacity": ("capacity", 0),
+    "smart overall-health self-assessment test result": ("health", 0),
+    "smart health status": ("health", 1),
+}
+
+# extract_value 使用的预编译正则（按优先级排列的元组）
+_SMART_RE_FLAGS = re.IGNORECASE | re.MULTILINE
+_RE_POWER_ON_HOURS = (
+    # 精确匹配属性9行
+    re.compile(r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)\s*$", _SMART_RE_FLAGS),
+    # 通用匹配模式
+    re.compile(r"9\s+Power_On_Hours\b.*?(\d+)\b", _SMART_RE_FLAGS),
+    re.compile(r"Power_On_Hours\b.*?(\d+)\b", _SMART_RE_FLAGS),
+    re.compile(r"Power On Hours\s+(\d+)", _SMART_RE_FLAGS),
+    re.compile(r"Power on time\s*:\s*(\d+)\s*hours", _SMART_RE_FLAGS),
+)
+
 class DiskManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
@@ -16,15 +43,23 @@ class DiskManager:
         self.initial_detection_done = False  # 首次完整检测完成标志
         self.disk_io_stats_cache = {}  # 缓存磁盘I/O统计信息
     
-    def extract_value(self, text: str, patterns, default="未知", format_func=None):
+    def _cache_put(self, device: str, disk_info: dict):
+        """缓存硬盘完整信息（直接保存引用，读取方只合并不修改）"""
+        self.disk_full_info_cache[device] = disk_info
+    
+    def _apply_cached_or_default(self, disk_info: dict, cached: dict, default="未知", health_default="检测失败"):
+        """用缓存信息回填硬盘字段，缓存中缺失的字段使用默认值"""
+        disk_info.update({k: cached.get(k) or default for k in _CACHED_FALLBACK_FIELDS})
+        disk_info["health"] = cached.get("health") or health_default
+        disk_info["attributes"] = cached.get("attributes", {})
+    
+    def extract_value(self, text: str, patterns: tuple, default="未知", format_func=None):
+        """按顺序用预编译正则元组匹配，返回第一个命中的值"""
         if not text:
             return default
         
-        if not isinstance(patterns, list):
-            patterns = [patterns]
-            
         for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
+            matches = pattern.findall(text)
             if matches:
                 value = matches[0]
                 try:
@@ -33,9 +68,34 @@ class DiskManager:
                     self.logger.debug("Format error for value '%s': %s", value, str(e))
                     return value.strip()
         
-        self.logger.debug("No match found for patterns: %s", patterns)
+        self.logger.debug("No match found for patterns: %s", [p.pattern for p in patterns])
         return default
     
+    def _parse_info_blob(self, info_output: str) -> dict:
+        """单次遍历解析smartctl输出中的固定"键: 值"行（型号、序列号、容量、健康状态）"""
+        result = {}
+        ranks = {}
+        if not info_output:
+            return result
+        
+        for line in info_output.splitlines():
+            key, sep, value = line.partition(":")
+            if not sep:
+                continue
+            slot = _INFO_KEY_MAP.get(key.strip().lower())
+            if slot is None:
+                continue
+            field, rank = slot
+            value = value.strip()
+            if value and rank < ranks.get(field, len(_INFO_KEY_MAP)):
+                result[field] = value
+                ranks[field] = rank
+        
+        # 容量只保留方括号前的字节数部分
+        if "capacity" in result:
+            result["capacity"] = result["capacity"].partition("[")[0].strip()
+        return result
+    
     async def check_disk_active(self, device: str, window: int = 30) -> bool:
         """检查硬盘在指定时间窗口内是否有活动"""
         try:
@@ -244,79 +304,36 @@ class DiskManager:
                 # 检查是否有缓存的完整信息
                 cached_info = self.disk_full_info_cache.get(device, {})
                 
-                # 优化点：首次运行时强制获取完整信息
-                if self.first_run:
-                    self.logger.debug(f"首次运行，强制获取硬盘 {device} 的完整信息")
-                    try:
-                        # 执行完整的信息获取
-                        await self._get_full_disk_info(disk_info, device_path)
-                        # 更新缓存
-                        self.disk_full_info_cache[device] = disk_info.copy()
-                    except Exception as e:
-                        self.logger.warning(f"首次运行获取硬盘信息失败: {str(e)}", exc_info=True)
-                        # 使用缓存信息（如果有）
-                        disk_info.update(cached_info)
-                        disk_info.update({
-                            "model": "未知" if not cached_info.get("model") else cached_info["model"],
-                            "serial": "未知" if not cached_info.get("serial") else cached_info["serial"],
-                            "capacity": "未知" if not cached_info.get("capacity") else cached_info["capacity"],
-                            "health": "检测失败" if not cached_info.get("health") else cached_info["health"],
-                            "temperature": "未知" if not cached_info.get("temperature") else cached_info["temperature"],
-                            "power_on_hours": "未知" if not cached_info.get("power_on_hours") else cached_info["power_on_hours"],
-                            "attributes": cached_info.get("attributes", {})
-                        })
+                # 已休眠的硬盘直接使用缓存，不再读取统计信息，避免额外访问唤醒硬盘
+                if status == "休眠中":
+                    self.logger.debug(f"硬盘 {device} 处于休眠状态，使用上一次获取的信息")
+                    self._apply_cached_or_default(disk_info, cached_info, default="未检测", health_default="未检测")
                     disks.append(disk_info)
                     continue
                 
-                # 检查硬盘是否活跃
-                is_active = await self.check_disk_active(device, window=30)
-                if not is_active:
+                # 首次运行时强制获取完整信息，之后只对活跃硬盘重新获取
+                needs_full = self.first_run or await self.check_disk_active(device, window=30)
+                if not needs_full:
                     self.logger.debug(f"硬盘 {device} 处于非活跃状态，使用上一次获取的信息")
                     
-                    # 优先使用缓存的完整信息
-                    if cached_info:
-                        disk_info.update({
-                            "model": cached_info.get("model", "未检测"),
-                            "serial": cached_info.get("serial", "未检测"),
-                            "capacity": cached_info.get("capacity", "未检测"),
-                            "health": cached_info.get("health", "未检测"),
-                            "temperature": cached_info.get("temperature", "未检测"),
-                            "power_on_hours": cached_info.get("power_on_hours", "未检测"),
-                            "attributes": cached_info.get("attributes", {})
-                        })
-                    else:
-                        # 如果没有缓存信息，使用默认值
-                        disk_info.update({
-                            "model": "未检测",
-                            "serial": "未检测",
-                            "capacity": "未检测",
-                            "health": "未检测",
-                            "temperature": "未检测",
-                            "power_on_hours": "未检测",
-                            "attributes": {}
-                        })
+                    # 优先使用缓存的完整信息，没有缓存时使用默认值
+                    self._apply_cached_or_default(disk_info, cached_info, default="未检测", health_default="未检测")
                     
                     disks.append(disk_info)
                     continue
                 
+                if self.first_run:
+                    self.logger.debug(f"首次运行，强制获取硬盘 {device} 的完整信息")
+                
                 try:
                     # 执行完整的信息获取
                     await self._get_full_disk_info(disk_info, device_path)
                     # 更新缓存
-                    self.disk_full_info_cache[device] = disk_info.copy()
+                    self._cache_put(device, disk_info)
                 except Exception as e:
                     self.logger.warning(f"获取硬盘信息失败: {str(e)}", exc_info=True)
                     # 使用缓存信息（如果有）
-                    disk_info.update(cached_info)
-                    disk_info.update({
-                        "model": "未知" if not cached_info.get("model") else cached_info["model"],
-                        "serial": "未知" if not cached_info.get("serial") else cached_info["serial"],
-                        "capacity": "未知" if not cached_info.get("capacity") else cached_info["capacity"],
-                        "health": "检测失败" if not cached_info.get("health") else cached_info["health"],
-                        "temperature": "未知" if not cached_info.get("temperature") else cached_info["temperature"],
-                        "power_on_hours": "未知" if not cached_info.get("power_on_hours") else cached_info["power_on_hours"],
-                        "attributes": cached_info.get("attributes", {})
-                    })
+                    self._apply_cached_or_default(disk_info, cached_info)
                 
                 disks.append(disk_info)
                 self.logger.debug("Processed disk %s: %s", device, disk_info)
@@ -334,44 +351,29 @@ class DiskManager:
             self.logger.error("Failed to get disk info: %s", str(e), exc_info=True)
             return []
     
+    def _split_smart_output(self, smart_output: str) -> tuple:
+        """按 "=== START OF" 段标题拆分 smartctl -a 输出，返回 (信息段, 数据段)"""
+        sections = smart_output.split("=== START OF", 2)
+        if len(sections) < 3:
+            # 没有标准段标题（如设备不支持或命令出错），两个解析器都使用完整输出
+            return smart_output, smart_output
+        return sections[1], sections[2]
+    
     async def _get_full_disk_info(self, disk_info, device_path):
         """获取硬盘的完整信息（模型、序列号、健康状态等）"""
-        # 获取基本信息
-        info_output = await self.coordinator.run_command(f"smartctl -i {device_path}")
-        self.logger.debug("smartctl -i output for %s: %s", disk_info["device"], info_output[:200] + "..." if len(info_output) > 200 else info_output)
-        
-        # 模型
-        disk_info["model"] = self.extract_value(
-            info_output, 
-            [
-                r"Device Model:\s*(.+)",
-                r"Model(?: Family)?\s*:\s*(.+)",
-                r"Model\s*Number:\s*(.+)"
-            ]
-        )
+        # 一次 smartctl -a 调用获取信息段、健康状态和属性表，只打开设备一次
+        smart_output = await self.coordinator.run_command(f"smartctl -a {device_path}")
+        self.logger.debug("smartctl -a output for %s: %s", disk_info["device"], smart_output[:200] + "..." if len(smart_output) > 200 else smart_output)
+        info_output, data_output = self._split_smart_output(smart_output)
         
-        # 序列号
-        disk_info["serial"] = self.extract_value(
-            info_output, 
-            r"Serial Number\s*:\s*(.+)"
-        )
-        
-        # 容量
-        disk_info["capacity"] = self.extract_value(
-            info_output, 
-            r"User Capacity:\s*([^[]+)"
-        )
+        # 模型、序列号、容量
+        info = self._parse_info_blob(info_output)
+        disk_info["model"] = info.get("model", "未知")
+        disk_info["serial"] = info.get("serial", "未知")
+        disk_info["capacity"] = info.get("capacity", "未知")
         
         # 健康状态
-        health_output = await self.coordinator.run_command(f"smartctl -H {device_path}")
-        raw_health = self.extract_value(
-            health_output,
-            [
-                r"SMART overall-health self-assessment test result:\s*(.+)",
-                r"SMART Health Status:\s*(.+)"
-            ],
-            default="UNKNOWN"
-        )
+        raw_health = self._parse_info_blob(data_output).get("health", "UNKNOWN")
 
         # 健康状态中英文映射
         health_map = {
@@ -391,10 +393,6 @@ class DiskManager:
         # 转换为中文（不区分大小写）
         disk_info["health"] = health_map.get(raw_health.strip().upper(), "未知")
         
-        # 获取详细数据
-        data_output = await self.coordinator.run_command(f"smartctl -A {device_path}")
-        self.logger.debug("smartctl -A output for %s: %s", disk_info["device"], data_output[:200] + "..." if len(data_output) > 200 else data_output)
-        
         # 智能温度检测逻辑 - 处理多温度属性
         temp_patterns = [
             # 新增的NVMe专用模式
@@ -471,16 +469,7 @@ class DiskManager:
         if power_on_hours == "未知":
             power_on_hours = self.extract_value(
                 data_output,
-                [
-                    # 精确匹配属性9行
-                    r"^\s*9\s+Power_On_Hours\b[^\n]+\s+(\d+)\s*$",
-                    
-                    # 通用匹配模式
-                    r"9\s+Power_On_Hours\b.*?(\d+)\b",
-                    r"Power_On_Hours\b.*?(\d+)\b",
-                    r"Power On Hours\s+(\d+)",
-                    r"Power on time\s*:\s*(\d+)\s*hours"
-                ],
+                _RE_POWER_ON_HOURS,
                 default="未知",
                 format_func=lambda x: f"{int(x)} 小时"
             )
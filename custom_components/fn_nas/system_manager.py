@@ -1,17 +1,149 @@
 import logging
 import asyncio
 import os
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
+from .utils import safe_float
 
 _LOGGER = logging.getLogger(__name__)
 
+# hwmon 驱动名称前缀（/sys/class/hwmon/hwmon*/name），按优先级排列；cpu_thermal 为ARM平台热区注册的hwmon设备
+_HWMON_CPU_DRIVERS = ("k10temp", "coretemp", "cpu_thermal")
+_HWMON_MOBO_DRIVERS = ("nct", "it87", "acpitz")
+_HWMON_DIR = "/sys/class/hwmon"
+# grep -H 输出：hwmon编号、temp编号与文件类型（name行为空）、内容
+_HWMON_ENTRY_RE = re.compile(r"^/sys/class/hwmon/hwmon(\d+)/(?:name|temp(\d+)_(label|input)):(.*)$", re.MULTILINE)
+
+# sensors 输出中的温度行：标签、温度值（°C，部分环境下度数符号缺失或显示为 º）
+_TEMP_RE = re.compile(r"^([^:\n]+):[ \t]*([+-]?\d+(?:\.\d+)?)[ \t]*[°º]?C\b", re.MULTILINE)
+# 温度标签关键词（按标签单词匹配）
+_CPU_AMD_KEYS = frozenset({"tctl", "tdie", "k10temp"})
+_CPU_INTEL_KEYS = frozenset({"package", "core", "coretemp"})
+_MOBO_KEYS = frozenset({"motherboard", "mobo", "mb", "system", "chipset", "ambient", "temp1", "temp2", "temp3", "systin"})
+_MOBO_EXCLUDE_KEYS = frozenset({"cpu", "core", "package", "processor", "tctl", "tdie"})
+_EXCLUDE_KEYS = frozenset({"fan", "rpm"})
+# 常见CPU主温度标签，按优先级优先采用
+_CPU_PRIORITY_LABELS = ("Tctl", "Tdie", "Package id 0", "Core 0")
+# 通用CPU标签（对小写标签做子串匹配，兼容 CPUTIN、CPU_Temp 等写法）
+_GENERIC_CPU_RE = re.compile(r"cpu|processor")
+# hwmon 与 sensors 温度标签拆分为单词（SYSTIN、MB_Temp、PCH Temp 等）
+_LABEL_SPLIT_RE = re.compile(r"[\s_]+")
+
+# 温度读取结果的缓存时间（秒），避免同一轮更新中重复读取
+_TEMP_CACHE_TTL = 2.0
+
+# sensors 命令每隔多少次轮询才真正执行一次（hwmon读取开销很小，不受此限制）
+_SENSORS_POLL_EVERY = 4
+
+# sensors 命令连续失败后的最长退避时间（秒）
+_SENSORS_MAX_BACKOFF = 300
+
+# 分区名末尾的分区编号（sda1、nvme0n1p1、mmcblk0p2）
+_PARTITION_SUFFIX_RE = re.compile(r"p?\d+$")
+
+# 合并命令中各段输出之间的分隔标记
+_SECTION_SEP = "@@FNNAS_SECTION@@"
+
+def _read_small_file(path: str) -> str:
+    """读取本机 procfs/sysfs 小文件，失败时返回空字符串"""
+    try:
+        with open(path, "rb") as f:
+            return f.read().decode(errors="replace").strip()
+    except OSError:
+        return ""
+
+def _parse_grep_h(output: str) -> dict:
+    """解析 grep -H 输出为 {路径: 内容}"""
+    values = {}
+    for line in (output or "").splitlines():
+        path, _, value = line.rpartition(":")
+        values[path] = value
+    return values
+
+def _read_sysfs_batch(paths) -> dict:
+    """在同一线程中依次读取多个sysfs小文件，返回 {路径: 内容}"""
+    return {path: _read_small_file(path) for path in paths}
+
+def _scan_hwmon() -> dict:
+    """遍历本机 /sys/class/hwmon，返回 {hwmon编号: (驱动名, {temp编号: 标签})}"""
+    chips = {}
+    try:
+        entries = list(os.scandir(_HWMON_DIR))
+    except OSError:
+        return chips
+    for entry in entries:
+        if not entry.name.startswith("hwmon"):
+            continue
+        labels = {}
+        try:
+            for item in os.scandir(entry.path):
+                if item.name.startswith("temp") and item.name.endswith("_label"):
+                    labels[item.name[4:-6]] = _read_small_file(item.path)
+        except OSError:
+            continue
+        chips[entry.name[5:]] = (_read_small_file(f"{entry.path}/name"), labels)
+    return chips
+
+def _parse_sensors_u(output: str) -> list:
+    """解析 `sensors -u` 的 key: value 输出，返回 [(芯片, 标签, 温度)]，每个标签只取 temp*_input"""
+    readings = []
+    chip = label = None
+    for line in output.splitlines():
+        if line[:1] in (" ", "\t"):
+            if label is None:
+                continue
+            key, _, value = line.strip().partition(":")
+            if key.startswith("temp") and key.endswith("_input"):
+                try:
+                    readings.append((chip, label, float(value)))
+                except ValueError:
+                    pass
+                label = None
+        elif not line:
+            chip = label = None
+        elif line.endswith(":"):
+            # 不缩进且以冒号结尾的是传感器标签
+            label = line[:-1]
+        else:
+            # 每段的第一行是芯片名，其后的 Adapter 行忽略
+            if chip is None:
+                chip = line
+            label = None
+    return readings
+
+_SIZE_UNITS = ('', 'K', 'M', 'G', 'T', 'P')
+
+def _bytes_to_human(b: int) -> str:
+    """字节数转换为易读格式（1024进制），先用整数移位确定单位，最后只做一次除法"""
+    exponent = 0
+    n = abs(b)
+    while n >= 1024 and exponent < len(_SIZE_UNITS) - 1:
+        n >>= 10
+        exponent += 1
+    return f"{b / (1 << (10 * exponent)):.1f}{_SIZE_UNITS[exponent]}"
+
+@lru_cache(maxsize=8)
+def _format_uptime_minutes(total_minutes: int) -> str:
+    """按分钟数格式化运行时间，输出每分钟才变化一次，因此可以缓存"""
+    days, remainder = divmod(total_minutes, 1440)
+    hours, minutes = divmod(remainder, 60)
+    
+    parts = []
+    if days >= 1:
+        parts.append(f"{days}天")
+    if hours >= 1:
+        parts.append(f"{hours}小时")
+    if minutes >= 1 or not parts:  # 如果时间很短也要显示分钟
+        parts.append(f"{minutes}分钟")
+        
+    return " ".join(parts)
+
 class SystemManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
         self.logger = _LOGGER.getChild("system_manager")
-        # 根据Home Assistant的日志级别动态设置
-        self.logger.setLevel(logging.DEBUG if _LOGGER.isEnabledFor(logging.DEBUG) else logging.INFO)
-        self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)  # 基于HA调试模式
         self.sensors_debug_path = "/config/fn_nas_debug"
         
         # 温度传感器缓存
@@ -19,18 +151,40 @@ class SystemManager:
             "hwmon_id": None,
             "temp_id": None,
             "driver_type": None,
-            "label": None
+            "label": None,
+            "adapter": None,  # sensors -u 中的芯片名
+            "line_key": None  # sensors -u 中的温度标签
         }
         self.mobo_temp_cache = {
             "hwmon_id": None,
             "temp_id": None,
-            "label": None
+            "driver_type": None,
+            "label": None,
+            "adapter": None,
+            "line_key": None
         }
+        self._hwmon_discovered = False
+        self._temp_ttl = _TEMP_CACHE_TTL
+        self._temps_cache = (0.0, None)  # (time.monotonic() 时间戳, 温度结果)
+        self._hwmon_temps_cache = (0.0, None)  # 仅hwmon读数，供内核温度接口使用
+        # sensors 命令熔断：连续失败次数与下次允许调用的时间
+        self._sensors_failures = 0
+        self._sensors_next_try = 0.0
+        # sensors 轮询计数与上次通过sensors得到的温度
+        self._temp_tick = 0
+        self._last_temps = {"cpu": "未知", "motherboard": "未知"}
+        # 上一次解析的sensors输出及结果，输出完全相同时直接复用
+        self._sensors_parsed = (None, ("未知", "未知"))
+
+    @property
+    def debug_enabled(self) -> bool:
+        """是否启用调试日志，实时跟随HA的日志级别"""
+        return self.logger.isEnabledFor(logging.DEBUG)
 
-    def _debug_log(self, message: str):
-        """只在调试模式下输出详细日志"""
+    def _debug_log(self, message: str, *args):
+        """只在调试模式下输出详细日志，参数按 % 格式延迟格式化"""
         if self.debug_enabled:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
 
     def _info_log(self, message: str):
         """重要信息日志"""
@@ -44,32 +198,68 @@ class SystemManager:
         """错误日志"""
         self.logger.error(message)
 
+    async def _read_proc(self, path: str) -> str:
+        """读取 procfs/sysfs 小文件：本机直接读取，远程主机通过 cat"""
+        if self.coordinator.reads_locally:
+            return await asyncio.to_thread(_read_small_file, path)
+        return await self.coordinator.run_command(f"cat {path} 2>/dev/null")
+
+    async def _collect_all(self) -> list:
+        """一次命令获取运行时间、内存、存储卷和hwmon温度原始输出，返回 [uptime, meminfo, df, hwmon] 四段
+        
+        hwmon段只在已定位温度文件时读取，否则为空
+        """
+        if self.coordinator.reads_locally:
+            # 本机直接读取 procfs，只有 df 需要执行命令；hwmon由 _read_hwmon_temps 直接读取
+            uptime_output = await self._read_proc("/proc/uptime")
+            meminfo_output = await self._read_proc("/proc/meminfo")
+            df_output = await self.coordinator.run_command("df -B 1 /vol* 2>/dev/null")
+            return [uptime_output, meminfo_output, df_output, ""]
+        
+        command = (
+            f"cat /proc/uptime; echo {_SECTION_SEP}; "
+            f"cat /proc/meminfo; echo {_SECTION_SEP}; "
+            f"df -B 1 /vol* 2>/dev/null"
+        )
+        paths = self._hwmon_input_paths()
+        if paths:
+            command += f"; echo {_SECTION_SEP}; grep -H . {' '.join(paths.values())} 2>/dev/null"
+        output = await self.coordinator.run_command(f"sh -c '{command}'")
+        sections = [section.strip() for section in output.split(_SECTION_SEP)] if output else []
+        # 命令失败时补齐缺失的段
+        sections.extend([""] * (4 - len(sections)))
+        return sections[:4]
+
+    def _parse_uptime(self, uptime_output: str) -> dict:
+        """解析 /proc/uptime 输出"""
+        if uptime_output:
+            try:
+                # 只取第一个字段，不拆分整行
+                uptime_seconds = float(uptime_output.partition(" ")[0])
+                return {"uptime_seconds": uptime_seconds, "uptime": self.format_uptime(uptime_seconds)}
+            except ValueError:
+                pass
+        return {"uptime_seconds": 0, "uptime": "未知"}
+
     async def get_system_info(self) -> dict:
         """获取系统信息"""
         system_info = {}
         try:
-            # 获取原始运行时间（秒数）
-            uptime_output = await self.coordinator.run_command("cat /proc/uptime")
-            if uptime_output:
-                try:
-                    uptime_seconds = float(uptime_output.split()[0])
-                    system_info["uptime_seconds"] = uptime_seconds
-                    system_info["uptime"] = self.format_uptime(uptime_seconds)
-                except (ValueError, IndexError):
-                    system_info["uptime_seconds"] = 0
-                    system_info["uptime"] = "未知"
-            else:
-                system_info["uptime_seconds"] = 0
-                system_info["uptime"] = "未知"
+            # 运行时间、内存、存储卷及已定位的hwmon温度合并为一次命令获取
+            uptime_output, mem_output, df_output, hwmon_output = await self._collect_all()
+            system_info.update(self._parse_uptime(uptime_output))
 
             # 一次性获取CPU和主板温度
-            temps = await self.get_temperatures_from_sensors()
+            temps = await self.get_temperatures_from_sensors(_parse_grep_h(hwmon_output))
             system_info["cpu_temperature"] = temps["cpu"]
             system_info["motherboard_temperature"] = temps["motherboard"]
 
-            mem_info = await self.get_memory_info()
-            system_info.update(mem_info)
-            vol_info = await self.get_vol_usage()
+            system_info.update(self.parse_meminfo(mem_output))
+            
+            vol_info = self.parse_df_bytes(df_output) if df_output else {}
+            if not vol_info:
+                # 合并命令未得到卷信息时，使用完整的卷检测流程
+                vol_info = await self.get_vol_usage()
             system_info["volumes"] = vol_info
             return system_info
 
@@ -86,23 +276,186 @@ class SystemManager:
                 "volumes": {}
             }
 
-    async def get_temperatures_from_sensors(self) -> dict:
-        """一次性获取CPU和主板温度"""
+    async def _discover_hwmon(self) -> dict:
+        """扫描一次hwmon设备名称和温度标签，确定CPU和主板温度文件
+        
+        远程时同一条命令顺带读出所有 temp*_input，返回 {路径: 数值}，供本轮直接使用
+        """
+        readings = {}
+        if self.coordinator.reads_locally:
+            chips = await asyncio.to_thread(_scan_hwmon)
+        else:
+            output = await self.coordinator.run_command(
+                f"grep -H . {_HWMON_DIR}/hwmon*/name {_HWMON_DIR}/hwmon*/temp*_label "
+                f"{_HWMON_DIR}/hwmon*/temp*_input 2>/dev/null"
+            )
+            chips = {}
+            for match in _HWMON_ENTRY_RE.finditer(output or ""):
+                hwmon_id, temp_id, kind, value = match.groups()
+                chip = chips.setdefault(hwmon_id, ["", {}])
+                if temp_id is None:
+                    chip[0] = value.strip()
+                elif kind == "label":
+                    chip[1][temp_id] = value.strip()
+                else:
+                    readings[f"{_HWMON_DIR}/hwmon{hwmon_id}/temp{temp_id}_input"] = value
+        
+        if not chips:
+            # 命令失败时输出同样为空，不记为已扫描，下次轮询重新扫描
+            self._debug_log("未找到hwmon设备，使用sensors命令获取温度")
+            return readings
+        self._hwmon_discovered = True
+        
+        for drivers, cache, pick in (
+            (_HWMON_CPU_DRIVERS, self.cpu_temp_cache, self._pick_cpu_label),
+            (_HWMON_MOBO_DRIVERS, self.mobo_temp_cache, self._pick_mobo_label)
+        ):
+            for prefix in drivers:
+                found = next(
+                    ((hwmon_id, name, labels) for hwmon_id, (name, labels) in sorted(chips.items(), key=lambda item: int(item[0]))
+                     if name.startswith(prefix)),
+                    None
+                )
+                if found:
+                    hwmon_id, name, labels = found
+                    # 无标签时驱动的 temp1 即为主温度（Tctl / Package id 0 / SYSTIN）
+                    temp_id, label = pick(labels) or ("1", None)
+                    cache.update(hwmon_id=hwmon_id, temp_id=temp_id, driver_type=name, label=label)
+                    self._debug_log("hwmon温度源: hwmon%s/temp%s (%s %s)", hwmon_id, temp_id, name, label)
+                    break
+        
+        # 未识别的CPU驱动（如 zenpower），按标签查找CPU主温度
+        if self.cpu_temp_cache["hwmon_id"] is None:
+            for hwmon_id, (name, labels) in sorted(chips.items(), key=lambda item: int(item[0])):
+                picked = self._pick_cpu_label(labels)
+                if picked:
+                    temp_id, label = picked
+                    self.cpu_temp_cache.update(hwmon_id=hwmon_id, temp_id=temp_id, driver_type=name, label=label)
+                    self._debug_log("hwmon温度源: hwmon%s/temp%s (%s %s)", hwmon_id, temp_id, name, label)
+                    break
+        return readings
+
+    @staticmethod
+    def _pick_cpu_label(labels: dict):
+        """按优先级在温度标签中选择CPU主温度，返回 (temp编号, 标签) 或 None"""
+        for wanted in _CPU_PRIORITY_LABELS:
+            for temp_id, label in labels.items():
+                if label == wanted:
+                    return temp_id, label
+        return None
+
+    @staticmethod
+    def _pick_mobo_label(labels: dict):
+        """在温度标签中选择主板温度，返回 (temp编号, 标签) 或 None"""
+        for temp_id, label in sorted(labels.items(), key=lambda item: int(item[0])):
+            words = set(_LABEL_SPLIT_RE.split(label.lower()))
+            if words & _MOBO_KEYS and not words & _MOBO_EXCLUDE_KEYS:
+                return temp_id, label
+        return None
+
+    def _hwmon_input_paths(self) -> dict:
+        """已定位的hwmon温度文件路径，返回 {"cpu"/"motherboard": 路径}"""
+        return {
+            key: f"{_HWMON_DIR}/hwmon{cache['hwmon_id']}/temp{cache['temp_id']}_input"
+            for key, cache in (("cpu", self.cpu_temp_cache), ("motherboard", self.mobo_temp_cache))
+            if cache["hwmon_id"] is not None
+        }
+
+    async def _read_hwmon_temps(self, readings: dict = None) -> dict:
+        """直接读取已定位的hwmon温度文件（毫摄氏度），一次命令读取全部
+        
+        readings 为调用方已读出的 {路径: 数值}，包含全部所需文件时不再执行命令
+        """
+        temps = {"cpu": "未知", "motherboard": "未知"}
+        readings = readings or {}
+        if not self._hwmon_discovered:
+            readings = await self._discover_hwmon()
+        
+        paths = self._hwmon_input_paths()
+        if not paths:
+            return temps
+        
+        targets = {"cpu": self.cpu_temp_cache, "motherboard": self.mobo_temp_cache}
+        if all(path in readings for path in paths.values()):
+            # 本轮已一并读出温度值，不再重复执行命令
+            values = readings
+        elif self.coordinator.reads_locally:
+            # 所有文件放在一次线程调用中读取，避免逐个文件切换线程
+            values = await asyncio.to_thread(_read_sysfs_batch, paths.values())
+        else:
+            output = await self.coordinator.run_command(f"grep -H . {' '.join(paths.values())} 2>/dev/null")
+            values = _parse_grep_h(output)
+        
+        for key, path in paths.items():
+            cache = targets[key]
+            value = safe_float(values.get(path))
+            if value is None:
+                # 读取失败（如驱动重新加载导致编号变化），下次重新扫描
+                self._debug_log("读取hwmon%s温度失败，清除缓存", cache['hwmon_id'])
+                cache.update(hwmon_id=None, temp_id=None, driver_type=None, label=None)
+                self._hwmon_discovered = False
+                continue
+            
+            temp = value / 1000.0
+            # 与sensors解析保持一致的合理范围
+            if (0 < temp < 150) if key == "cpu" else (15 <= temp <= 70):
+                temps[key] = f"{temp:.1f} °C"
+        return temps
+
+    async def get_temperatures_from_sensors(self, hwmon_readings: dict = None) -> dict:
+        """一次性获取CPU和主板温度，短时间内的重复调用直接返回缓存结果
+        
+        hwmon_readings 为合并命令中已读出的hwmon温度 {路径: 数值}，可省去单独的读取命令
+        """
+        cached_at, cached = self._temps_cache
+        if cached is not None and time.monotonic() - cached_at < self._temp_ttl:
+            return cached
+        
+        temps = await self._fetch_temperatures(hwmon_readings)
+        self._temps_cache = (time.monotonic(), temps)
+        return temps
+
+    async def _fetch_temperatures(self, hwmon_readings: dict = None) -> dict:
+        """优先直接读取hwmon，缺失的温度再用sensors命令补全"""
+        temps = await self._read_hwmon_temps(hwmon_readings)
+        if "未知" not in temps.values():
+            return temps
+        
+        # sensors 不可用（未安装或无可用温度）时退避，避免每次轮询都执行
+        if time.monotonic() < self._sensors_next_try:
+            self._debug_log("sensors命令处于退避期，跳过")
+            return temps
+        
+        # 温度变化缓慢，sensors 只在每第N次轮询时执行，其余时间沿用上次结果
+        run_sensors = self._temp_tick == 0
+        self._temp_tick = (self._temp_tick + 1) % _SENSORS_POLL_EVERY
+        missing = [key for key, value in temps.items() if value == "未知"]
+        if not run_sensors:
+            return {**temps, **{key: self._last_temps[key] for key in missing}}
+        
         try:
-            command = "sensors"
-            self._debug_log(f"执行sensors命令获取温度: {command}")
+            # -u 输出为稳定的 key: value 格式，不受不同lm_sensors版本显示格式影响
+            command = "sensors -u"
+            self._debug_log("执行sensors命令获取温度: %s", command)
             
             sensors_output = await self.coordinator.run_command(command)
-            if self.debug_enabled:
-                self._debug_log(f"sensors命令输出长度: {len(sensors_output) if sensors_output else 0}")
+            self._debug_log("sensors命令输出长度: %d", len(sensors_output) if sensors_output else 0)
             
             if not sensors_output:
                 self._warning_log("sensors命令无输出")
-                return {"cpu": "未知", "motherboard": "未知"}
+                self._sensors_failed()
+                return temps
             
-            # 同时解析CPU和主板温度
-            cpu_temp = self.extract_cpu_temp_from_sensors(sensors_output)
-            mobo_temp = self.extract_mobo_temp_from_sensors(sensors_output)
+            # 只采用hwmon未能提供的温度
+            sensors_cpu, sensors_mobo = self._extract_sensors_temps(sensors_output)
+            self._last_temps = {"cpu": sensors_cpu, "motherboard": sensors_mobo}
+            # hwmon缺失的温度sensors也一个都补不上时同样视为失败并退避
+            if all(self._last_temps[key] == "未知" for key in missing):
+                self._sensors_failed()
+            else:
+                self._sensors_failures = 0
+            cpu_temp = temps["cpu"] if temps["cpu"] != "未知" else sensors_cpu
+            mobo_temp = temps["motherboard"] if temps["motherboard"] != "未知" else sensors_mobo
             
             # 记录获取结果
             if cpu_temp != "未知":
@@ -119,16 +472,65 @@ class SystemManager:
             
         except Exception as e:
             self._error_log(f"使用sensors命令获取温度失败: {e}")
-            return {"cpu": "未知", "motherboard": "未知"}
+            self._sensors_failed()
+            return temps
+
+    def _extract_sensors_temps(self, sensors_output: str) -> tuple:
+        """按上次记录的芯片/标签直接取温度，找不到时再完整解析并更新记录"""
+        last_output, last_result = self._sensors_parsed
+        if sensors_output == last_output:
+            return last_result
+        result = self._parse_sensors_temps(sensors_output)
+        self._sensors_parsed = (sensors_output, result)
+        return result
+
+    def _parse_sensors_temps(self, sensors_output: str) -> tuple:
+        """解析sensors输出得到 (cpu, motherboard)，优先使用记录的芯片/标签"""
+        if "_input:" not in sensors_output:
+            return self.extract_temps(sensors_output)
+        readings = _parse_sensors_u(sensors_output)
+        
+        # 仅当两个温度都已记录位置且读数在合理范围内时才走快速路径，否则完整解析
+        slots = (self.cpu_temp_cache, self.mobo_temp_cache)
+        if all(cache["line_key"] is not None for cache in slots):
+            lookup = {(chip, label): temp for chip, label, temp in readings}
+            cpu, mobo = (lookup.get((cache["adapter"], cache["line_key"])) for cache in slots)
+            if cpu is not None and mobo is not None and 0 < cpu < 150 and 15 <= mobo <= 70:
+                return f"{cpu:.1f} °C", f"{mobo:.1f} °C"
+            self._debug_log("sensors温度位置已变化或读数超出范围，重新解析")
+        
+        selected = self._select_temps(readings, self._priority_from_readings(readings))
+        for cache, reading in zip(slots, selected):
+            chip, label = reading[:2] if reading else (None, None)
+            cache.update(adapter=chip, line_key=label)
+        return tuple(f"{reading[2]:.1f} °C" if reading else "未知" for reading in selected)
+
+    def _sensors_failed(self):
+        """记录一次sensors失败，按指数退避推迟下次调用"""
+        # 退避时间达到上限后不再增加计数，避免指数无限增长
+        self._sensors_failures = min(self._sensors_failures + 1, _SENSORS_MAX_BACKOFF.bit_length())
+        backoff = min(2 ** self._sensors_failures, _SENSORS_MAX_BACKOFF)
+        self._sensors_next_try = time.monotonic() + backoff
+        self._debug_log("sensors连续失败%d次，%d秒内不再调用", self._sensors_failures, backoff)
+
+    async def _get_hwmon_temps_cached(self) -> dict:
+        """读取hwmon温度，短时间内的重复调用直接返回缓存结果"""
+        cached_at, cached = self._hwmon_temps_cache
+        if cached is not None and time.monotonic() - cached_at < self._temp_ttl:
+            return cached
+        
+        temps = await self._read_hwmon_temps()
+        self._hwmon_temps_cache = (time.monotonic(), temps)
+        return temps
 
     async def get_cpu_temp_from_kernel(self) -> str:
-        """获取CPU温度 - 向后兼容"""
-        temps = await self.get_temperatures_from_sensors()
+        """从内核hwmon获取CPU温度 - 向后兼容，只读取已缓存的温度文件"""
+        temps = await self._get_hwmon_temps_cached()
         return temps["cpu"]
 
     async def get_mobo_temp_from_kernel(self) -> str:
-        """获取主板温度 - 向后兼容"""
-        temps = await self.get_temperatures_from_sensors()
+        """从内核hwmon获取主板温度 - 向后兼容，只读取已缓存的温度文件"""
+        temps = await self._get_hwmon_temps_cached()
         return temps["motherboard"]
 
     async def get_cpu_temp_from_sensors(self) -> str:
@@ -141,155 +543,139 @@ class SystemManager:
         temps = await self.get_temperatures_from_sensors()
         return temps["motherboard"]
 
-    def extract_cpu_temp_from_sensors(self, sensors_output: str) -> str:
-        """从sensors输出中提取CPU温度"""
+    def extract_temps(self, sensors_output: str) -> tuple:
+        """单次扫描sensors输出，同时提取CPU和主板温度，返回 (cpu, motherboard)
+        
+        同时支持 `sensors -u` 与普通 `sensors` 的输出格式
+        """
+        if "_input:" in sensors_output:
+            readings = _parse_sensors_u(sensors_output)
+            priority = self._priority_from_readings(readings)
+        else:
+            readings = ((None, m.group(1).strip(), float(m.group(2))) for m in _TEMP_RE.finditer(sensors_output))
+            priority = self._find_priority_cpu_lines(sensors_output)
+        
+        selected = self._select_temps(readings, priority)
+        return tuple(f"{reading[2]:.1f} °C" if reading else "未知" for reading in selected)
+
+    def _select_temps(self, readings, priority) -> tuple:
+        """从 (芯片, 标签, 温度) 序列中选出CPU和主板温度，返回两个读数（未找到为None）"""
+        cpu = mobo = None
         try:
-            lines = sensors_output.split('\n')
-            self._debug_log(f"解析sensors输出，共{len(lines)}行")
+            # 优先采用常见的CPU主温度标签
+            for reading in priority:
+                if 0 < reading[2] < 150:
+                    self._info_log(f"从sensors提取CPU温度({reading[1]}): {reading[2]:.1f}°C")
+                    cpu = reading
+                    break
             
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                if self.debug_enabled:
-                    self._debug_log(f"第{i+1}行: {line_lower}")
+            for reading in readings:
+                if cpu is not None and mobo is not None:
+                    break
                 
-                # AMD CPU温度关键词
-                if any(keyword in line_lower for keyword in [
-                    "tctl", "tdie", "k10temp"
-                ]):
-                    self._debug_log(f"找到AMD CPU温度行: {line}")
-                    if '+' in line and '°c' in line_lower:
-                        try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
-                            temp = float(temp_match)
-                            if 0 < temp < 150:
-                                self._info_log(f"从sensors提取AMD CPU温度: {temp:.1f}°C")
-                                return f"{temp:.1f} °C"
-                        except (ValueError, IndexError) as e:
-                            self._debug_log(f"解析AMD温度失败: {e}")
-                            continue
+                _, label, temp = reading
+                name = label.lower()
+                tokens = _LABEL_SPLIT_RE.split(name)
+                if not _EXCLUDE_KEYS.isdisjoint(tokens):
+                    continue
                 
-                # Intel CPU温度关键词
-                if any(keyword in line_lower for keyword in [
-                    "package id", "core 0", "coretemp"
-                ]) and not any(exclude in line_lower for exclude in ["fan"]):
-                    self._debug_log(f"找到Intel CPU温度行: {line}")
-                    if '+' in line and '°c' in line_lower:
-                        try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
-                            temp = float(temp_match)
-                            if 0 < temp < 150:
-                                self._info_log(f"从sensors提取Intel CPU温度: {temp:.1f}°C")
-                                return f"{temp:.1f} °C"
-                        except (ValueError, IndexError) as e:
-                            self._debug_log(f"解析Intel温度失败: {e}")
-                            continue
+                if cpu is None and (
+                    not _CPU_AMD_KEYS.isdisjoint(tokens) or not _CPU_INTEL_KEYS.isdisjoint(tokens)
+                    or _GENERIC_CPU_RE.search(name)
+                ):
+                    if 0 < temp < 150:
+                        self._info_log(f"从sensors提取CPU温度({label}): {temp:.1f}°C")
+                        cpu = reading
+                    else:
+                        self._debug_log("CPU温度值超出合理范围: %s %.1f°C", label, temp)
                 
-                # 通用CPU温度模式
-                if ('cpu' in line_lower or 'processor' in line_lower) and '+' in line and '°c' in line_lower:
-                    self._debug_log(f"找到通用CPU温度行: {line}")
-                    try:
-                        temp_match = line.split('+')[1].split('°')[0].strip()
-                        temp = float(temp_match)
-                        if 0 < temp < 150:
-                            self._info_log(f"从sensors提取通用CPU温度: {temp:.1f}°C")
-                            return f"{temp:.1f} °C"
-                    except (ValueError, IndexError) as e:
-                        self._debug_log(f"解析通用CPU温度失败: {e}")
-                        continue
+                if mobo is None and not _MOBO_KEYS.isdisjoint(tokens) and _MOBO_EXCLUDE_KEYS.isdisjoint(tokens):
+                    # 主板温度通常在15-70度之间
+                    if 15 <= temp <= 70:
+                        self._info_log(f"从sensors提取主板温度({label}): {temp:.1f}°C")
+                        mobo = reading
+                    else:
+                        self._debug_log("主板温度值超出合理范围: %.1f°C", temp)
             
-            self._warning_log("未在sensors输出中找到CPU温度")
-            return "未知"
+            if cpu is None:
+                self._warning_log("未在sensors输出中找到CPU温度")
+            if mobo is None:
+                self._warning_log("未在sensors输出中找到主板温度")
             
         except Exception as e:
-            self._error_log(f"解析sensors CPU温度输出失败: {e}")
-            return "未知"
+            self._error_log(f"解析sensors温度输出失败: {e}")
+        return cpu, mobo
+
+    @staticmethod
+    def _priority_from_readings(readings: list):
+        """按优先级从 sensors -u 读数中产出常见的CPU主温度"""
+        first = {}
+        for reading in readings:
+            first.setdefault(reading[1], reading)
+        return (first[label] for label in _CPU_PRIORITY_LABELS if label in first)
+
+    @staticmethod
+    def _find_priority_cpu_lines(sensors_output: str):
+        """在普通sensors输出中用 str.find 按优先级定位CPU主温度行，逐个产出 (芯片, 标签, 温度)"""
+        for label in _CPU_PRIORITY_LABELS:
+            idx = sensors_output.find(label + ":")
+            if idx < 0:
+                continue
+            match = _TEMP_RE.match(sensors_output, sensors_output.rfind("\n", 0, idx) + 1)
+            if match:
+                yield None, match.group(1).strip(), float(match.group(2))
+
+    def extract_cpu_temp_from_sensors(self, sensors_output: str) -> str:
+        """从sensors输出中提取CPU温度 - 向后兼容"""
+        return self.extract_temps(sensors_output)[0]
 
     def extract_mobo_temp_from_sensors(self, sensors_output: str) -> str:
-        """从sensors输出中提取主板温度"""
-        try:
-            lines = sensors_output.split('\n')
-            self._debug_log(f"解析主板温度，共{len(lines)}行")
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                
-                # 主板温度关键词
-                if any(keyword in line_lower for keyword in [
-                    "motherboard", "mobo", "mb", "system", "chipset", 
-                    "ambient", "temp1:", "temp2:", "temp3:", "systin"
-                ]) and not any(cpu_keyword in line_lower for cpu_keyword in [
-                    "cpu", "core", "package", "processor", "tctl", "tdie"
-                ]) and not any(exclude in line_lower for exclude in ["fan", "rpm"]):
-                    
-                    self._debug_log(f"找到可能的主板温度行: {line}")
-                    
-                    if '+' in line and '°c' in line_lower:
-                        try:
-                            temp_match = line.split('+')[1].split('°')[0].strip()
-                            temp = float(temp_match)
-                            # 主板温度通常在15-70度之间
-                            if 15 <= temp <= 70:
-                                self._info_log(f"从sensors提取主板温度: {temp:.1f}°C")
-                                return f"{temp:.1f} °C"
-                            else:
-                                self._debug_log(f"主板温度值超出合理范围: {temp:.1f}°C")
-                        except (ValueError, IndexError) as e:
-                            self._debug_log(f"解析主板温度失败: {e}")
-                            continue
-            
-            self._warning_log("未在sensors输出中找到主板温度")
-            return "未知"
-            
-        except Exception as e:
-            self._error_log(f"解析sensors主板温度输出失败: {e}")
-            return "未知"
+        """从sensors输出中提取主板温度 - 向后兼容"""
+        return self.extract_temps(sensors_output)[1]
 
     def format_uptime(self, seconds: float) -> str:
-        """格式化运行时间为易读格式"""
-        try:
-            days, remainder = divmod(seconds, 86400)
-            hours, remainder = divmod(remainder, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            
-            parts = []
-            if days >= 1:
-                parts.append(f"{int(days)}天")
-            if hours >= 1:
-                parts.append(f"{int(hours)}小时")
-            if minutes >= 1 or not parts:  # 如果时间很短也要显示分钟
-                parts.append(f"{int(minutes)}分钟")
-                
-            return " ".join(parts)
-        except Exception as e:
-            self.logger.error("Failed to format uptime: %s", str(e))
-            return "未知"
+        """格式化运行时间为易读格式（按分钟缓存）"""
+        return _format_uptime_minutes(int(seconds // 60))
     
     async def get_memory_info(self) -> dict:
         """获取内存使用信息"""
         try:
-            # 使用 free 命令获取内存信息（-b 选项以字节为单位）
-            mem_output = await self.coordinator.run_command("free -b")
-            if not mem_output:
-                return {}
+            # 直接读取 /proc/meminfo，不再调用 free 命令
+            mem_output = await self.coordinator.run_command("cat /proc/meminfo")
+            return self.parse_meminfo(mem_output)
+        except Exception as e:
+            self._error_log(f"获取内存信息失败: {str(e)}")
+            return {}
+    
+    def parse_meminfo(self, meminfo_output: str) -> dict:
+        """解析 /proc/meminfo 输出（单位kB），返回字节数"""
+        if not meminfo_output:
+            return {}
+        
+        try:
+            fields = {}
+            for line in meminfo_output.splitlines():
+                key, sep, value = line.partition(":")
+                if sep and key in ("MemTotal", "MemFree", "MemAvailable", "Buffers", "Cached"):
+                    fields[key] = int(value.strip().removesuffix("kB")) * 1024
             
-            # 解析输出
-            lines = mem_output.splitlines()
-            if len(lines) < 2:
-                return {}
-                
-            # 第二行是内存信息（Mem行）
-            mem_line = lines[1].split()
-            if len(mem_line) < 7:
+            if "MemTotal" not in fields:
                 return {}
+            
+            total = fields["MemTotal"]
+            # 旧内核没有 MemAvailable，按 free + buffers + cached 估算
+            available = fields.get("MemAvailable")
+            if available is None:
+                available = fields.get("MemFree", 0) + fields.get("Buffers", 0) + fields.get("Cached", 0)
                 
             return {
-                "memory_total": int(mem_line[1]),
-                "memory_used": int(mem_line[2]),
-                "memory_available": int(mem_line[6])
+                "memory_total": total,
+                "memory_used": total - available,
+                "memory_available": available
             }
             
-        except Exception as e:
-            self._error_log(f"获取内存信息失败: {str(e)}")
+        except (ValueError, IndexError) as e:
+            self._error_log(f"解析内存信息失败: {str(e)}")
             return {}
     
     async def get_vol_usage(self) -> dict:
@@ -302,33 +688,20 @@ class SystemManager:
                 # 只查询活跃的卷，避免使用通配符可能唤醒所有磁盘
                 vol_list = " ".join(active_vols)
                 df_output = await self.coordinator.run_command(f"df -B 1 {vol_list} 2>/dev/null")
-                if df_output:
-                    result = self.parse_df_bytes(df_output)
-                    if result:  # 确保有数据返回
-                        return result
-                
-                df_output = await self.coordinator.run_command(f"df -h {vol_list} 2>/dev/null")
-                if df_output:
-                    result = self.parse_df_human_readable(df_output)
-                    if result:  # 确保有数据返回
-                        return result
+                result = self.parse_df_bytes(df_output) if df_output else {}
+                if result:  # 确保有数据返回
+                    return result
             
             # 如果智能检测失败，回退到传统方法（仅在必要时）
             self._debug_log("智能卷检测无结果，回退到传统检测方法")
             
-            # 优先使用字节单位，但添加错误处理
+            # 只使用字节单位，易读格式由 parse_df_bytes 在Python中转换
             df_output = await self.coordinator.run_command("df -B 1 /vol* 2>/dev/null || true")
             if df_output and "No such file or directory" not in df_output:
                 result = self.parse_df_bytes(df_output)
                 if result:
                     return result
             
-            df_output = await self.coordinator.run_command("df -h /vol* 2>/dev/null || true")
-            if df_output and "No such file or directory" not in df_output:
-                result = self.parse_df_human_readable(df_output)
-                if result:
-                    return result
-            
             # 最后的回退：尝试检测任何挂载的卷
             mount_output = await self.coordinator.run_command("mount | grep '/vol' || true")
             if mount_output:
@@ -340,11 +713,11 @@ class SystemManager:
                             vol_points.append(part)
                 
                 if vol_points:
-                    self._debug_log(f"从mount输出检测到卷: {vol_points}")
+                    self._debug_log("从mount输出检测到卷: %s", vol_points)
                     vol_list = " ".join(vol_points)
-                    df_output = await self.coordinator.run_command(f"df -h {vol_list} 2>/dev/null || true")
+                    df_output = await self.coordinator.run_command(f"df -B 1 {vol_list} 2>/dev/null || true")
                     if df_output:
-                        return self.parse_df_human_readable(df_output)
+                        return self.parse_df_bytes(df_output)
             
             self._debug_log("所有存储卷检测方法都失败，返回空字典")
             return {}
@@ -356,59 +729,83 @@ class SystemManager:
     async def check_active_volumes(self) -> list:
         """检查当前活跃的存储卷，避免唤醒休眠磁盘"""
         try:
-            # 获取所有挂载点，这个操作不会访问磁盘内容
-            mount_output = await self.coordinator.run_command("mount | grep '/vol' 2>/dev/null || true")
-            if not mount_output:
+            command = "findmnt -rn -o TARGET,SOURCE"
+            if self.debug_enabled:
+                # 磁盘活跃状态只用于调试日志，仅在调试时顺带读取块设备I/O统计（不会访问磁盘内容）
+                command = (
+                    f"sh -c '{command}; echo {_SECTION_SEP}; "
+                    f"grep -H . /sys/block/*/stat /sys/block/dm-*/dm/name 2>/dev/null'"
+                )
+            output = await self.coordinator.run_command(command)
+            mount_output, _, stat_output = (output or "").partition(_SECTION_SEP)
+            mounts = [line.split() for line in mount_output.splitlines() if line.startswith('/vol')]
+            if not mounts:
                 self._debug_log("未找到任何/vol挂载点")
                 return []
             
+            block_stats = self.parse_block_stats(stat_output)
             active_vols = []
             
-            for line in mount_output.splitlines():
-                if '/vol' in line:
-                    # 提取挂载点
-                    parts = line.split()
-                    mount_point = None
-                    
-                    # 查找挂载点（通常在 'on' 关键词之后）
-                    try:
-                        on_index = parts.index('on')
-                        if on_index + 1 < len(parts):
-                            candidate = parts[on_index + 1]
-                            # 严格检查是否以/vol开头
-                            if candidate.startswith('/vol'):
-                                mount_point = candidate
-                    except ValueError:
-                        # 如果没有 'on' 关键词，查找以/vol开头的部分
-                        for part in parts:
-                            if part.startswith('/vol'):
-                                mount_point = part
-                                break
-                    
-                    # 过滤挂载点：只保留根级别的/vol*挂载点
-                    if mount_point and self.is_root_vol_mount(mount_point):
-                        # 检查这个卷对应的磁盘是否活跃
-                        is_active = await self.is_volume_disk_active(mount_point)
-                        if is_active:
-                            active_vols.append(mount_point)
-                            self._debug_log(f"添加活跃卷: {mount_point}")
-                        else:
-                            # 即使磁盘不活跃，也添加到列表中，但标记为可能休眠
-                            # 这样可以保证有基本的存储信息
-                            active_vols.append(mount_point)
-                            self._debug_log(f"卷 {mount_point} 对应磁盘可能休眠，但仍包含在检测中")
+            for parts in mounts:
+                if len(parts) < 2:
+                    continue
+                mount_point, source = parts[0], parts[1]
+                
+                # 过滤挂载点：只保留根级别的/vol*挂载点
+                if self.is_root_vol_mount(mount_point):
+                    if self.is_volume_disk_active(source, block_stats):
+                        self._debug_log("添加活跃卷: %s", mount_point)
                     else:
-                        self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                        # 即使磁盘不活跃，也添加到列表中，但标记为可能休眠
+                        # 这样可以保证有基本的存储信息
+                        self._debug_log("卷 %s 对应磁盘可能休眠，但仍包含在检测中", mount_point)
+                    active_vols.append(mount_point)
+                else:
+                    self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
             
             # 去重并排序
-            active_vols = sorted(list(set(active_vols)))
-            self._debug_log(f"最终检测到的根级别/vol存储卷: {active_vols}")
+            active_vols = sorted(set(active_vols))
+            self._debug_log("最终检测到的根级别/vol存储卷: %s", active_vols)
             return active_vols
             
         except Exception as e:
-            self._debug_log(f"检查活跃存储卷失败: {e}")
+            self._debug_log("检查活跃存储卷失败: %s", e)
             return []
     
+    def parse_block_stats(self, stat_output: str) -> dict:
+        """解析 grep -H . /sys/block/*/stat 的输出，返回 {设备名: in_flight}
+        
+        同时包含 /sys/block/dm-*/dm/name 时，额外以 mapper/<名称> 记录对应dm设备的统计
+        """
+        block_stats = {}
+        mapper_names = {}
+        for line in stat_output.splitlines():
+            path, _, values = line.strip().partition(":")
+            if not path.startswith("/sys/block/"):
+                continue
+            device, _, attr = path[11:].partition("/")
+            if attr == "dm/name":
+                mapper_names[f"mapper/{values.strip()}"] = device
+                continue
+            fields = values.split()
+            # 第9个字段为当前进行中的I/O请求数
+            if len(fields) > 8 and fields[8].isdigit():
+                block_stats[device] = int(fields[8])
+        for alias, device in mapper_names.items():
+            if device in block_stats:
+                block_stats[alias] = block_stats[device]
+        return block_stats
+    
+    def is_volume_disk_active(self, source: str, block_stats: dict) -> bool:
+        """根据挂载源（如 /dev/sda1、/dev/md0、/dev/mapper/vg-vol1）判断对应块设备当前是否有I/O"""
+        if not source.startswith("/dev/"):
+            return False
+        name = source[5:]
+        if name not in block_stats:
+            # 分区统计在父设备上：sda1 -> sda，nvme0n1p1 -> nvme0n1
+            name = _PARTITION_SUFFIX_RE.sub("", name)
+        return block_stats.get(name, 0) > 0
+    
     def is_root_vol_mount(self, mount_point: str) -> bool:
         """检查是否为根级别的/vol挂载点"""
         if not mount_point or not mount_point.startswith('/vol'):
@@ -434,22 +831,25 @@ class SystemManager:
         # /vol1/docker/overlay2/...
         # /vol1/data/...
         # /vol1/config/...
-        self._debug_log(f"检测到子目录挂载点: {mount_point}")
+        self._debug_log("检测到子目录挂载点: %s", mount_point)
         return False
 
     def parse_df_bytes(self, df_output: str) -> dict:
         """解析df命令的字节输出"""
         volumes = {}
         try:
-            for line in df_output.splitlines()[1:]:  # 跳过标题行
-                parts = line.split()
+            lines = iter(df_output.splitlines())
+            next(lines, None)  # 跳过标题行
+            for line in lines:
+                # 最多拆成6列，挂载点中的空格保留在最后一列
+                parts = line.split(None, 5)
                 if len(parts) < 6:
                     continue
                     
-                mount_point = parts[-1]
+                mount_point = parts[5].rstrip()
                 # 严格检查只处理根级别的 /vol 挂载点
-                if not self.is_root_vol_mount(mount_point):
-                    self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                if not mount_point.startswith("/vol") or not self.is_root_vol_mount(mount_point):
+                    self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
                     continue
                     
                 try:
@@ -458,23 +858,16 @@ class SystemManager:
                     avail_bytes = int(parts[3])
                     use_percent = parts[4]
                     
-                    def bytes_to_human(b):
-                        for unit in ['', 'K', 'M', 'G', 'T']:
-                            if abs(b) < 1024.0:
-                                return f"{b:.1f}{unit}"
-                            b /= 1024.0
-                        return f"{b:.1f}P"
-                    
                     volumes[mount_point] = {
                         "filesystem": parts[0],
-                        "size": bytes_to_human(size_bytes),
-                        "used": bytes_to_human(used_bytes),
-                        "available": bytes_to_human(avail_bytes),
+                        "size": _bytes_to_human(size_bytes),
+                        "used": _bytes_to_human(used_bytes),
+                        "available": _bytes_to_human(avail_bytes),
                         "use_percent": use_percent
                     }
-                    self._debug_log(f"添加根级别/vol存储卷信息: {mount_point}")
+                    self._debug_log("添加根级别/vol存储卷信息: %s", mount_point)
                 except (ValueError, IndexError) as e:
-                    self._debug_log(f"解析存储卷行失败: {line} - {str(e)}")
+                    self._debug_log("解析存储卷行失败: %s - %s", line, e)
                     continue
         except Exception as e:
             self._error_log(f"解析df字节输出失败: {e}")
@@ -482,18 +875,21 @@ class SystemManager:
         return volumes
     
     def parse_df_human_readable(self, df_output: str) -> dict:
-        """解析df命令输出"""
+        """解析df -h命令输出 - 向后兼容，轮询流程只使用 df -B 1"""
         volumes = {}
         try:
-            for line in df_output.splitlines()[1:]:  # 跳过标题行
-                parts = line.split()
+            lines = iter(df_output.splitlines())
+            next(lines, None)  # 跳过标题行
+            for line in lines:
+                # 最多拆成6列，挂载点中的空格保留在最后一列
+                parts = line.split(None, 5)
                 if len(parts) < 6:
                     continue
                     
-                mount_point = parts[-1]
+                mount_point = parts[5].rstrip()
                 # 严格检查只处理根级别的 /vol 挂载点
-                if not self.is_root_vol_mount(mount_point):
-                    self._debug_log(f"跳过非根级别vol挂载点: {mount_point}")
+                if not mount_point.startswith("/vol") or not self.is_root_vol_mount(mount_point):
+                    self._debug_log("跳过非根级别vol挂载点: %s", mount_point)
                     continue
                     
                 try:
@@ -509,9 +905,9 @@ class SystemManager:
                         "available": avail,
                         "use_percent": use_percent
                     }
-                    self._debug_log(f"添加根级别/vol存储卷信息: {mount_point}")
+                    self._debug_log("添加根级别/vol存储卷信息: %s", mount_point)
                 except (ValueError, IndexError) as e:
-                    self._debug_log(f"解析存储卷行失败: {line} - {str(e)}")
+                    self._debug_log("解析存储卷行失败: %s - %s", line, e)
                     continue
         except Exception as e:
             self._error_log(f"解析df输出失败: {e}")
@@ -1,12 +1,58 @@
 import logging
+import asyncio
 import re
 import json
 import os
 from datetime import datetime
 from .const import DOMAIN, UPS_INFO
+from .utils import safe_float
 
 _LOGGER = logging.getLogger(__name__)
 
+# UPS信息的默认值，使用时复制并填入 last_update
+_UPS_INFO_TEMPLATE = {
+    "status": "未知",
+    "battery_level": "未知",
+    "runtime_remaining": "未知",
+    "input_voltage": "未知",
+    "output_voltage": "未知",
+    "load_percent": "未知",
+    "model": "未知",
+    "ups_type": "未知",
+    "last_update": None
+}
+
+# NUT字段映射：(upsc键名, ups_info键名, 类型转换, 带单位的显示格式)
+_NUT_FIELDS = (
+    ("battery.charge", "battery_level", float, "{:.1f}%"),
+    ("battery.runtime", "runtime_remaining", lambda v: int(v) // 60, "{}分钟"),  # 秒转换为分钟
+    ("input.voltage", "input_voltage", float, "{:.1f}V"),
+    ("output.voltage", "output_voltage", float, "{:.1f}V"),
+    ("ups.load", "load_percent", float, "{:.1f}%"),
+)
+
+# NUT ups.status 状态标志，按优先级排列
+_STATUS_MAP = {
+    "OL": "在线",
+    "OB": "电池供电",
+    "LB": "电池电量低",
+    "HB": "电池电量高",
+    "RB": "需要更换电池",
+    "CHRG": "正在充电",
+    "DISCHRG": "正在放电",
+    "BYPASS": "旁路模式",
+    "CAL": "校准中",
+    "OFF": "离线",
+    "OVER": "过载",
+    "TRIM": "电压调整中",
+    "BOOST": "电压提升中",
+    "FSD": "强制关机",
+    "ALARM": "警报状态"
+}
+
+# lsusb 输出中的设备描述：ID 厂商:产品 描述
+_USB_MODEL_RE = re.compile(r"ID\s+\w+:\w+\s+(.+)")
+
 class UPSManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
@@ -15,6 +61,8 @@ class UPSManager:
         self.logger.setLevel(logging.DEBUG if _LOGGER.isEnabledFor(logging.DEBUG) else logging.INFO)
         self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)  # 基于HA调试模式
         self.ups_debug_path = "/config/fn_nas_ups_debug"
+        self._debug_dir_ready = False
+        self._status_cache = {}  # 原始状态字符串 -> 中文状态
 
     def _debug_log(self, message: str):
         """只在调试模式下输出详细日志"""
@@ -35,17 +83,9 @@ class UPSManager:
     
     async def get_ups_info(self) -> dict:
         """获取连接的UPS信息"""
-        ups_info = {
-            "status": "未知",
-            "battery_level": "未知",
-            "runtime_remaining": "未知",
-            "input_voltage": "未知",
-            "output_voltage": "未知",
-            "load_percent": "未知",
-            "model": "未知",
-            "ups_type": "未知",
-            "last_update": datetime.now().isoformat()
-        }
+        # 本次轮询统一使用同一个时间戳
+        last_update = datetime.now().isoformat()
+        ups_info = dict(_UPS_INFO_TEMPLATE, last_update=last_update)
         
         try:
             # 尝试使用NUT工具获取UPS信息
@@ -64,36 +104,27 @@ class UPSManager:
                     self._debug_log(f"UPS详细信息: {ups_details}")
                     
                     # 保存UPS数据以便调试
-                    self.save_ups_data_for_debug(ups_details)
+                    if self.debug_enabled:
+                        await self.save_ups_data_for_debug(ups_details)
                     
                     # 解析UPS信息
-                    return self.parse_nut_ups_info(ups_details)
+                    return self.parse_nut_ups_info(ups_details, last_update)
                 else:
                     self._debug_log("未找到连接的UPS")
             else:
                 self._debug_log("未安装NUT工具，尝试备用方法")
             
             # 备用方法：尝试直接读取UPS状态
-            return await self.get_ups_info_fallback()
+            return await self.get_ups_info_fallback(last_update)
             
         except Exception as e:
             self._error_log(f"获取UPS信息时出错: {str(e)}")
             return ups_info
     
-    async def get_ups_info_fallback(self) -> dict:
+    async def get_ups_info_fallback(self, last_update: str = None) -> dict:
         """备用方法获取UPS信息"""
         self._info_log("尝试备用方法获取UPS信息")
-        ups_info = {
-            "status": "未知",
-            "battery_level": "未知",
-            "runtime_remaining": "未知",
-            "input_voltage": "未知",
-            "output_voltage": "未知",
-            "load_percent": "未知",
-            "model": "未知",
-            "ups_type": "未知",
-            "last_update": datetime.now().isoformat()
-        }
+        ups_info = dict(_UPS_INFO_TEMPLATE, last_update=last_update or datetime.now().isoformat())
         
         try:
             # 方法1: 检查USB连接的UPS
@@ -103,7 +134,7 @@ class UPSManager:
                 ups_info["ups_type"] = "USB"
                 
                 # 尝试从输出中提取型号
-                model_match = re.search(r"ID\s+\w+:\w+\s+(.+)", usb_ups_output)
+                model_match = _USB_MODEL_RE.search(usb_ups_output)
                 if model_match:
                     ups_info["model"] = model_match.group(1).strip()
             
@@ -114,11 +145,9 @@ class UPSManager:
             
             # 方法3: 尝试读取UPS电池信息
             battery_info = await self.coordinator.run_command("cat /sys/class/power_supply/*/capacity 2>/dev/null || echo ''")
-            if battery_info and battery_info.strip().isdigit():
-                try:
-                    ups_info["battery_level"] = int(battery_info.strip())
-                except (ValueError, TypeError):
-                    pass
+            battery_level = safe_float(battery_info)
+            if battery_level is not None:
+                ups_info["battery_level"] = int(battery_level)
             
             # 创建带单位的字符串表示形式
             try:
@@ -132,145 +161,64 @@ class UPSManager:
             self._error_log(f"备用方法获取UPS信息失败: {str(e)}")
             return ups_info
     
-    def parse_nut_ups_info(self, ups_output: str) -> dict:
+    def parse_nut_ups_info(self, ups_output: str, last_update: str = None) -> dict:
         """解析NUT工具输出的UPS信息"""
-        ups_info = {
-            "status": "未知",
-            "battery_level": "未知",
-            "runtime_remaining": "未知",
-            "input_voltage": "未知",
-            "output_voltage": "未知",
-            "load_percent": "未知",
-            "model": "未知",
-            "ups_type": "NUT",
-            "last_update": datetime.now().isoformat()
-        }
+        ups_info = dict(_UPS_INFO_TEMPLATE, ups_type="NUT", last_update=last_update or datetime.now().isoformat())
         
         # 尝试解析键值对格式
         data = {}
         for line in ups_output.splitlines():
-            if ':' in line:
-                key, value = line.split(':', 1)
+            key, sep, value = line.partition(':')
+            if sep:
                 data[key.strip()] = value.strip()
         
         # 映射关键信息
         ups_info["model"] = data.get("ups.model", "未知")
         ups_info["status"] = self.map_ups_status(data.get("ups.status", "未知"))
         
-        # 电池信息 - 转换为浮点数
-        battery_charge = data.get("battery.charge")
-        if battery_charge:
-            try:
-                ups_info["battery_level"] = float(battery_charge)
-            except (ValueError, TypeError):
-                pass
-        
-        # 剩余运行时间 - 转换为整数（分钟）
-        runtime_left = data.get("battery.runtime")
-        if runtime_left:
-            try:
-                minutes = int(runtime_left) // 60
-                ups_info["runtime_remaining"] = minutes
-            except (ValueError, TypeError):
-                pass
-        
-        # 输入电压 - 转换为浮点数
-        input_voltage = data.get("input.voltage")
-        if input_voltage:
-            try:
-                ups_info["input_voltage"] = float(input_voltage)
-            except (ValueError, TypeError):
-                pass
-        
-        # 输出电压 - 转换为浮点数
-        output_voltage = data.get("output.voltage")
-        if output_voltage:
-            try:
-                ups_info["output_voltage"] = float(output_voltage)
-            except (ValueError, TypeError):
-                pass
-        
-        # 负载百分比 - 转换为浮点数
-        load_percent = data.get("ups.load")
-        if load_percent:
-            try:
-                ups_info["load_percent"] = float(load_percent)
-            except (ValueError, TypeError):
-                pass
-        
-        # 创建带单位的字符串表示形式
-        try:
-            ups_info["battery_level_str"] = f"{ups_info['battery_level']:.1f}%" if isinstance(ups_info["battery_level"], float) else "未知"
-        except KeyError:
-            ups_info["battery_level_str"] = "未知"
-        
-        try:
-            ups_info["runtime_remaining_str"] = f"{ups_info['runtime_remaining']}分钟" if isinstance(ups_info["runtime_remaining"], int) else "未知"
-        except KeyError:
-            ups_info["runtime_remaining_str"] = "未知"
-        
-        try:
-            ups_info["input_voltage_str"] = f"{ups_info['input_voltage']:.1f}V" if isinstance(ups_info["input_voltage"], float) else "未知"
-        except KeyError:
-            ups_info["input_voltage_str"] = "未知"
-        
-        try:
-            ups_info["output_voltage_str"] = f"{ups_info['output_voltage']:.1f}V" if isinstance(ups_info["output_voltage"], float) else "未知"
-        except KeyError:
-            ups_info["output_voltage_str"] = "未知"
-        
-        try:
-            ups_info["load_percent_str"] = f"{ups_info['load_percent']:.1f}%" if isinstance(ups_info["load_percent"], float) else "未知"
-        except KeyError:
-            ups_info["load_percent_str"] = "未知"
+        # 数值字段：按表转换类型，并生成带单位的字符串表示形式
+        for src_key, dst_key, cast, fmt in _NUT_FIELDS:
+            value = data.get(src_key)
+            if value:
+                try:
+                    ups_info[dst_key] = cast(value)
+                except (ValueError, TypeError):
+                    pass
+            converted = ups_info[dst_key]
+            ups_info[f"{dst_key}_str"] = fmt.format(converted) if converted != "未知" else "未知"
         
         return ups_info
     
     def map_ups_status(self, status_str: str) -> str:
         """映射UPS状态到中文"""
-        status_map = {
-            "OL": "在线",
-            "OB": "电池供电",
-            "LB": "电池电量低",
-            "HB": "电池电量高",
-            "RB": "需要更换电池",
-            "CHRG": "正在充电",
-            "DISCHRG": "正在放电",
-            "BYPASS": "旁路模式",
-            "CAL": "校准中",
-            "OFF": "离线",
-            "OVER": "过载",
-            "TRIM": "电压调整中",
-            "BOOST": "电压提升中",
-            "FSD": "强制关机",
-            "ALARM": "警报状态"
-        }
-        
-        # 处理复合状态
-        for key, value in status_map.items():
-            if key in status_str:
-                return value
-        
-        return status_str if status_str else "未知"
+        cached = self._status_cache.get(status_str)
+        if cached is not None:
+            return cached
+        
+        # 处理复合状态（如 "OL CHRG"）：按优先级取第一个匹配的状态标志
+        tokens = set(status_str.split())
+        result = next((value for key, value in _STATUS_MAP.items() if key in tokens), None)
+        if result is None:
+            result = status_str if status_str else "未知"
+        self._status_cache[status_str] = result
+        return result
     
-    def save_ups_data_for_debug(self, ups_output: str):
-        """保存UPS数据以便调试"""
-        if not self.debug_enabled:
-            return
-            
+    async def save_ups_data_for_debug(self, ups_output: str):
+        """保存UPS数据以便调试，文件操作在线程中执行，不阻塞事件循环"""
         try:
-            # 创建调试目录
-            if not os.path.exists(self.ups_debug_path):
-                os.makedirs(self.ups_debug_path)
-            
             # 生成文件名
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = os.path.join(self.ups_debug_path, f"ups_{timestamp}.log")
             
-            # 写入文件
-            with open(filename, "w") as f:
-                f.write(ups_output)
-            
+            await asyncio.to_thread(self._write_debug_file, filename, ups_output)
             self._info_log(f"保存UPS数据到 {filename} 用于调试")
         except Exception as e:
-            self._error_log(f"保存UPS数据失败: {str(e)}")
\ No newline at end of file
+            self._error_log(f"保存UPS数据失败: {str(e)}")
+
+    def _write_debug_file(self, filename: str, content: str):
+        """写入调试文件，调试目录只在首次写入时创建"""
+        if not self._debug_dir_ready:
+            os.makedirs(self.ups_debug_path, exist_ok=True)
+            self._debug_dir_ready = True
+        with open(filename, "w") as f:
+            f.write(content)
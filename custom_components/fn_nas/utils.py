@@ -0,0 +1,6 @@
+def safe_float(text):
+    """把命令输出或文件内容转换为浮点数，为空或无法转换时返回 None"""
+    try:
+        return float(text.strip()) if text else None
+    except ValueError:
+        return None
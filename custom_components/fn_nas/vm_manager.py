@@ -4,6 +4,12 @@ from asyncssh import SSHClientConnection
 
 _LOGGER = logging.getLogger(__name__)
 
+# virsh dumpxml 输出中的虚拟机标题
+_VM_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+
+# virsh list 的状态列取值，多个单词的状态放在前面优先匹配
+_VM_STATES = ("in shutdown", "shut off", "running", "idle", "paused", "crashed", "pmsuspended", "blocked", "dying")
+
 class VMManager:
     def __init__(self, coordinator):
         self.coordinator = coordinator
@@ -12,6 +18,11 @@ class VMManager:
         # 根据Home Assistant的日志级别动态设置
         self.logger.setLevel(logging.DEBUG if _LOGGER.isEnabledFor(logging.DEBUG) else logging.INFO)
         self.debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        # 虚拟机标题缓存：标题只有在虚拟机重新定义时才会变化
+        self._title_cache = {}
+        self._vm_states = {}
+        # virsh 是否支持 --title：None 为尚未确定，首次失败后不再尝试
+        self._title_supported = None
 
     def _debug_log(self, message: str):
         """只在调试模式下输出详细日志"""
@@ -34,50 +45,96 @@ class VMManager:
         """获取虚拟机列表及其状态"""
         try:
             self._debug_log("开始获取虚拟机列表")
-            output = await self.coordinator.run_command("virsh list --all")
+            # --title 直接输出标题列，无需再逐个执行 virsh dumpxml
+            output = ""
+            if self._title_supported is not False:
+                output = await self.coordinator.run_command("virsh list --all --title")
+                if output:
+                    self._title_supported = True
+                elif self._title_supported is None:
+                    # 旧版virsh不支持 --title 或未安装libvirt，之后只执行普通命令
+                    self._title_supported = False
+            with_title = bool(output)
+            if not with_title and self._title_supported is False:
+                output = await self.coordinator.run_command("virsh list --all")
             self._debug_log(f"virsh命令输出: {output}")
             
-            self.vms = self._parse_vm_list(output)
+            self.vms = self._parse_vm_list(output, with_title)
+            self._invalidate_titles(self.vms)
             self._info_log(f"获取到{len(self.vms)}个虚拟机")
             return self.vms
         except Exception as e:
             self._error_log(f"获取虚拟机列表失败: {str(e)}")
             return []
 
-    def _parse_vm_list(self, output):
-        """解析虚拟机列表输出"""
+    def _invalidate_titles(self, vms):
+        """状态发生变化或已不存在的虚拟机，清除其标题缓存"""
+        states = {vm["name"]: vm["state"] for vm in vms}
+        for name in list(self._title_cache):
+            if states.get(name) != self._vm_states.get(name):
+                del self._title_cache[name]
+        self._vm_states = states
+
+    def _parse_vm_list(self, output, with_title=False):
+        """解析虚拟机列表输出，带 --title 时同时解析标题列"""
+        lines = iter(output.strip().splitlines())
+        # 跳过标题行和分隔线
+        next(lines, None)
+        next(lines, None)
+        
         vms = []
-        # 跳过标题行
-        lines = output.strip().split('\n')[2:]
         for line in lines:
-            if not line.strip():
+            # split(None, 2) 自动处理连续空白，状态列可能含空格（如 shut off）
+            parts = line.split(None, 2)
+            if len(parts) < 3:
                 continue
-            parts = line.split(maxsplit=2)  # 更健壮的解析方式
-            if len(parts) >= 3:
-                vm_id = parts[0].strip()
-                name = parts[1].strip()
-                state = parts[2].strip()
-                vms.append({
-                    "id": vm_id,
-                    "name": name,
-                    "state": state.lower(),
-                    "title": ""  # 将在后续填充
-                })
+            state, title = parts[2].rstrip(), ""  # 无标题列时将在后续填充
+            if with_title:
+                state, title = self._split_state_title(state)
+                title = title or parts[1]  # 没有标题时使用名称
+            vms.append({
+                "id": parts[0],
+                "name": parts[1],
+                "state": state.lower(),
+                "title": title
+            })
         return vms
 
+    @staticmethod
+    def _split_state_title(rest):
+        """把 "状态 标题" 拆开，状态可能由多个单词组成"""
+        lower = rest.lower()
+        for state in _VM_STATES:
+            if lower.startswith(state) and (len(rest) == len(state) or rest[len(state)].isspace()):
+                return rest[:len(state)], rest[len(state):].strip()
+        # 未知（如本地化）的状态按单个单词处理
+        state, _, title = rest.partition(" ")
+        return state, title.strip()
+
     async def get_vm_title(self, vm_name):
         """获取虚拟机的标题"""
+        # virsh list --title 已经给出标题时直接使用
+        for vm in self.vms:
+            if vm["name"] == vm_name and vm["title"]:
+                return vm["title"]
+        if vm_name in self._title_cache:
+            return self._title_cache[vm_name]
         try:
             self._debug_log(f"获取虚拟机{vm_name}的标题")
             output = await self.coordinator.run_command(f"virsh dumpxml {vm_name}")
+            if not output:
+                # 命令失败时不缓存，下次重新获取
+                return vm_name
             # 在XML输出中查找<title>标签
-            match = re.search(r'<title>(.*?)</title>', output, re.DOTALL)
+            match = _VM_TITLE_RE.search(output)
             if match:
                 title = match.group(1).strip()
                 self._debug_log(f"虚拟机{vm_name}标题: {title}")
-                return title
-            self._debug_log(f"虚拟机{vm_name}无标题，使用名称")
-            return vm_name  # 如果没有标题，则返回虚拟机名称
+            else:
+                self._debug_log(f"虚拟机{vm_name}无标题，使用名称")
+                title = vm_name  # 如果没有标题，则返回虚拟机名称
+            self._title_cache[vm_name] = title
+            return title
         except Exception as e:
             self._error_log(f"获取虚拟机标题失败: {str(e)}")
             return vm_name